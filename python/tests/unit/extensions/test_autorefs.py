@@ -27,9 +27,15 @@ from textwrap import dedent
 from typing import TYPE_CHECKING, Any
 
 import pytest
+from markupsafe import Markup
 
 from tests.unit.extensions.conftest import soup
-from zensical.extensions.autorefs import get_autorefs_store, reset
+from zensical.extensions.autorefs import (
+    get_autorefs_data,
+    get_autorefs_store,
+    reset,
+)
+from zensical.extensions.context import Page
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -513,3 +519,98 @@ class TestHeadingsTreeprocessor:
         store = get_autorefs_store()
         assert "no-id-heading" not in store._primary_url_map
         assert store._primary_url_map == {}
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+
+class TestStore:
+    """Tests for AutorefsStore.
+
+    The store keeps the URLs registered for each identifier in order of
+    registration, without duplicates, separately for primary and secondary.
+    """
+
+    def test_register_anchor_deduplicates_urls(self) -> None:
+        """Registering the same anchor twice keeps a single URL."""
+        store = get_autorefs_store()
+        page = Page(url="page", path="page.md")
+        store.register_anchor(page, "foo")
+        store.register_anchor(page, "foo", "bar")
+        store.register_anchor(page, "foo")
+        store.register_anchor(page, "foo", "bar")
+        assert store._primary_url_map == {"foo": ["page#foo", "page#bar"]}
+
+    def test_register_anchor_secondary(self) -> None:
+        """Secondary anchors don't end up in the primary URL map."""
+        store = get_autorefs_store()
+        page = Page(url="page", path="page.md")
+        store.register_anchor(page, "foo", primary=False)
+        store.register_anchor(page, "foo", primary=False)
+        assert store._primary_url_map == {}
+        assert store._secondary_url_map == {"foo": ["page#foo"]}
+
+    def test_register_anchor_str_subclass(self) -> None:
+        """Identifiers and anchors may be string subclasses, like `Markup`."""
+        store = get_autorefs_store()
+        page = Page(url="page", path="page.md")
+        store.register_anchor(page, Markup("foo"), title="Foo")
+        store.register_anchor(page, Markup("foo"), Markup("bar"))
+        assert store._primary_url_map == {"foo": ["page#foo", "page#bar"]}
+        assert store._title_map == {"page#foo": "Foo"}
+        assert type(next(iter(store._primary_url_map))) is str
+        assert all(type(url) is str for url in store._primary_url_map["foo"])
+
+    def test_reset_clears_store(self) -> None:
+        """Resetting keeps the store instance, but drops all registered data."""
+        store = get_autorefs_store()
+        page = Page(url="page", path="page.md")
+        store.register_anchor(page, "foo", title="Foo")
+        store.register_url("bar", "https://example.com/#bar")
+        reset()
+        assert get_autorefs_store() is store
+        assert store._primary_url_map == {}
+        assert store._abs_url_map == {}
+        assert store._title_map == {}
+        store.register_anchor(page, "foo")
+        assert store._primary_url_map == {"foo": ["page#foo"]}
+
+    def test_register_urls_is_lazy(self) -> None:
+        """Lazily registered URLs are only consumed when data is requested."""
+        store = get_autorefs_store()
+        consumed = []
+
+        def items() -> Generator[tuple[str, str], None, None]:
+            consumed.append(True)
+            yield "foo", "https://example.com/#foo"
+
+        store.register_urls(items())
+        assert not consumed
+        assert get_autorefs_data()["inventory"] == {
+            "foo": "https://example.com/#foo"
+        }
+        assert consumed == [True]
+
+    def test_register_urls_keeps_data_on_error(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Errors while consuming URLs are logged, keeping all other data."""
+        store = get_autorefs_store()
+        page = Page(url="page", path="page.md")
+        store.register_anchor(page, "foo")
+
+        def items() -> Generator[tuple[str, str], None, None]:
+            yield "bar", "https://example.com/#bar"
+            raise OSError("download failed")
+
+        store.register_urls(items())
+        store.register_urls([("baz", "https://example.com/#baz")])
+        data = get_autorefs_data()
+        assert data["primary"] == {"foo": ["page#foo"]}
+        assert data["inventory"] == {
+            "bar": "https://example.com/#bar",
+            "baz": "https://example.com/#baz",
+        }
+        assert "download failed" in caplog.text
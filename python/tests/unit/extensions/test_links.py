@@ -0,0 +1,95 @@
+# Copyright (c) 2025-2026 Zensical and contributors
+
+# SPDX-License-Identifier: MIT
+# All contributions are certified under the DCO
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+from __future__ import annotations
+
+import pytest
+
+from zensical.extensions.links import _rewrite_parsed_url, _rewrite_url
+
+# ---------------------------------------------------------------------------
+# Rewriting
+# ---------------------------------------------------------------------------
+
+
+class TestRewriteUrl:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "a.md",
+            "a.md;x",
+            "index.md;p",
+            "dir/index.md",
+            "dir/README.md",
+            "README.md",
+            "../a.md",
+            "./a.md",
+            "a/b/c.md",
+            "a.md#section",
+            "a.md?q=1",
+            "a.md;x?q=1#section",
+            "a.md/",
+            "image.png",
+            "dir/",
+            "#section",
+            "?q=1",
+            "/a.md",
+            "//example.com/a.md",
+            "https://example.com/a.md",
+            "mailto:test@example.org",
+            "a b.md",
+            " a.md",
+            "a.md ",
+            "a\tb.md",
+            "a.md\n",
+            "%20a.md",
+            "ä.md",
+            "a\\b.md",
+            "[a].md",
+            "a@b.md",
+            "a=b.md",
+        ],
+    )
+    @pytest.mark.parametrize("path", ["index.md", "page.md", "dir/page.md"])
+    @pytest.mark.parametrize("use_directory_urls", [True, False])
+    def test_fast_path_matches_parsed(
+        self, value: str, path: str, use_directory_urls: bool
+    ) -> None:
+        assert _rewrite_url(value, path, use_directory_urls) == (
+            _rewrite_parsed_url(value, path, use_directory_urls)
+        )
+
+    @pytest.mark.parametrize(
+        ("value", "use_directory_urls", "expected"),
+        [
+            pytest.param("a.md", True, "../a/", id="directory_urls"),
+            pytest.param("a.md", False, "a.html", id="flat_urls"),
+            pytest.param("a.md;x", True, "../a/;x", id="params"),
+            pytest.param("index.md;p", False, "index.html;p", id="index"),
+            pytest.param("README.md", False, "index.html", id="readme"),
+        ],
+    )
+    def test_rewrites_relative_links(
+        self, value: str, use_directory_urls: bool, expected: str
+    ) -> None:
+        assert _rewrite_url(value, "page.md", use_directory_urls) == expected
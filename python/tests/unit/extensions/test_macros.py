@@ -30,10 +30,11 @@ import pytest
 from jinja2.exceptions import TemplateSyntaxError, UndefinedError
 
 from tests.unit.extensions.conftest import soup
-from zensical.extensions.context import ContextPreprocessor
+from zensical.extensions.context import ContextPreprocessor, Page
 from zensical.extensions.macros import (
     MacroEnv,
     _add_indentation,
+    _context_closure,
     _convert_to_md_table,
     _fix_url,
     _get_fake_table_readers,
@@ -129,6 +130,16 @@ class TestMacroEnv:
         assert env.macros["twice"](4) == 8
         assert env.filters["rev"]("abc") == "cba"
 
+    def test_context_lists_page_attributes(self) -> None:
+        page = Page(url="/", path="index.md", title="Home")
+        context = _context_closure({"page": page})
+        assert [row[0] for row in context(page)] == [
+            "meta",
+            "path",
+            "title",
+            "url",
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Loading YAML
@@ -0,0 +1,124 @@
+# Copyright (c) 2025-2026 Zensical and contributors
+
+# SPDX-License-Identifier: MIT
+# All contributions are certified under the DCO
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+from __future__ import annotations
+
+from urllib.parse import urlparse, urlsplit
+
+import pytest
+
+from zensical.extensions.preview import (
+    PreviewConfig,
+    _get_filters,
+    _get_path,
+    _is_external,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+URLS = [
+    "page.md",
+    "../page.md#section",
+    "page.md;params?query#section",
+    "#section",
+    "",
+    "/page.md",
+    "https://example.com/page.md",
+    "HTTPS://example.com",
+    "mailto:test@example.com",
+    "c:page.md",
+    "1a:page.md",
+    "a_b:page.md",
+    "//example.com/page.md",
+    "//?query",
+    "//#section",
+    "///page.md",
+    "//",
+    "\tht\ntps://example.com",
+    "/\t/example.com",
+    " \x01https://example.com",
+    "\x01 page.md",
+    "page\r.md",
+    "\u017fhttps://example.com",
+    "\u212ahttps://example.com",
+]
+"""URLs with edge cases, which must be handled exactly like `urlsplit` does."""
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestFilters:
+    def test_skips_empty_configurations(self) -> None:
+        config = PreviewConfig(
+            configurations=[{}, {"targets": {"include": ["a/*"]}}]
+        )
+        filters = _get_filters(config)
+        assert len(filters) == 1
+        sources, targets = filters[0]
+        assert sources("page.md")
+        assert targets("a/page.md")
+        assert not targets("b/page.md")
+
+    def test_shares_filters_of_equal_configurations(self) -> None:
+        first = PreviewConfig(targets={"include": ["a/*"]})
+        second = PreviewConfig(targets={"include": ["a/*"]})
+        assert _get_filters(first) is _get_filters(second)
+
+    def test_creates_filters_for_changed_configurations(self) -> None:
+        first = PreviewConfig(targets={"include": ["a/*"]})
+        second = PreviewConfig(targets={"include": ["b/*"]})
+        assert _get_filters(first) is not _get_filters(second)
+        [(_, targets)] = _get_filters(second)
+        assert targets("b/page.md")
+        assert not targets("a/page.md")
+
+
+class TestUrls:
+    @pytest.mark.parametrize("href", URLS)
+    def test_is_external_matches_urlsplit(self, href: str) -> None:
+        url = urlsplit(href)
+        assert _is_external(href) == bool(url.scheme or url.netloc)
+
+    @pytest.mark.parametrize(
+        "href", [href for href in URLS if not _is_external(href)]
+    )
+    def test_get_path_matches_urlparse(self, href: str) -> None:
+        assert _get_path(href) == urlparse(href).path
+
+    @pytest.mark.parametrize(
+        ("href", "expected"),
+        [
+            pytest.param("//example.com", True, id="network_location"),
+            pytest.param("//?query", False, id="empty_before_query"),
+            pytest.param("///page.md", False, id="empty_before_path"),
+            pytest.param("\tht\ntps://example.com", True, id="tab_newline"),
+            pytest.param("/\t/example.com", True, id="tab_in_slashes"),
+        ],
+    )
+    def test_is_external(self, href: str, expected: bool) -> None:
+        assert _is_external(href) is expected
@@ -0,0 +1,192 @@
+# Copyright (c) 2025-2026 Zensical and contributors
+
+# SPDX-License-Identifier: MIT
+# All contributions are certified under the DCO
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+from __future__ import annotations
+
+import pytest
+from markdown import Markdown
+
+from zensical.extensions.search import Parser, SearchConfig, SearchProcessor
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _parse(html: str) -> list[tuple[str | None, str, str]]:
+    """Parse HTML into a list of section identifiers, titles and texts."""
+    parser = Parser()
+    parser.feed(html)
+    parser.close()
+    return [
+        (section.id, "".join(section.title), "".join(section.text))
+        for section in parser.data
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestParser:
+    @pytest.mark.parametrize(
+        ("html", "expected"),
+        [
+            pytest.param(
+                "<p>a<object><object>x</object>y</object>b</p>",
+                "<p>ab</p>",
+                id="nested_skipped_tags",
+            ),
+            pytest.param(
+                '<code class="linenodiv"><code>1</code>2</code><p>text</p>',
+                "<p>text</p>",
+                id="nested_line_numbers",
+            ),
+            pytest.param(
+                "<ol data-search-exclude><ol>a</ol>b</ol><p>c</p>",
+                "<p>c</p>",
+                id="nested_excluded_elements",
+            ),
+            pytest.param(
+                "<div data-search-exclude><p>a<object>b</object></p></div>c",
+                "c",
+                id="skipped_inside_excluded",
+            ),
+        ],
+    )
+    def test_skips_nested_elements(self, html: str, expected: str) -> None:
+        assert _parse(html) == [(None, "", expected)]
+
+    @pytest.mark.parametrize(
+        ("html", "expected"),
+        [
+            pytest.param(
+                "<p>a<object>x</p>y</object>b</p><p>c</p>",
+                "<p>ab</p><p>c</p>",
+                id="stray_end_tag_inside",
+            ),
+            pytest.param(
+                "<p>a</object>b</p>",
+                "<p>ab</p>",
+                id="stray_end_tag_outside",
+            ),
+            pytest.param(
+                "<p>a<object>b</p>",
+                "<p>a",
+                id="unclosed_skipped_tag",
+            ),
+        ],
+    )
+    def test_skips_unbalanced_elements(self, html: str, expected: str) -> None:
+        assert _parse(html) == [(None, "", expected)]
+
+    @pytest.mark.parametrize(
+        ("html", "expected"),
+        [
+            pytest.param(
+                "<p>a <mark>b <mark>c</mark></mark> d</p>",
+                "<p>a b c d</p>",
+                id="nested_marks",
+            ),
+            pytest.param(
+                "<p><code><mark>a</mark></code><mark><code>b</code></mark></p>",
+                "<p><code>a</code><code>b</code></p>",
+                id="marks_and_kept_tags",
+            ),
+        ],
+    )
+    def test_keeps_text_of_nested_marks(self, html: str, expected: str) -> None:
+        assert _parse(html) == [(None, "", expected)]
+
+    @pytest.mark.parametrize(
+        ("html", "expected"),
+        [
+            pytest.param(
+                '<div data-search-exclude><br><img src="x">a<br/></div>b',
+                "b",
+                id="inside_excluded",
+            ),
+            pytest.param(
+                "<object><br>a<img></object>b",
+                "b",
+                id="inside_skipped",
+            ),
+            pytest.param(
+                "<p>a<br>b<object><hr></object>c</p>",
+                "<p>abc</p>",
+                id="around_skipped",
+            ),
+        ],
+    )
+    def test_ignores_void_elements(self, html: str, expected: str) -> None:
+        assert _parse(html) == [(None, "", expected)]
+
+    @pytest.mark.parametrize(
+        ("html", "expected"),
+        [
+            pytest.param(
+                "<p>a<code></code>b<code>c</code><code> </code></p>",
+                "<p>ab<code>c</code></p>",
+                id="empty_after_non_empty",
+            ),
+            pytest.param(
+                "<ul><li><p>a</p></li><li><p></p></li></ul>",
+                "<ul><li><p>a</p></li></ul>",
+                id="empty_nested",
+            ),
+        ],
+    )
+    def test_removes_empty_elements(self, html: str, expected: str) -> None:
+        assert _parse(html) == [(None, "", expected)]
+
+    def test_excludes_sections(self) -> None:
+        parser = Parser()
+        parser.feed(
+            '<h1 id="a">A</h1><p>a</p>'
+            '<h2 id="b" data-search-exclude>B</h2><p>b</p>'
+            '<h2 id="c">C</h2><p>c</p>'
+        )
+        parser.close()
+        assert [section.is_excluded() for section in parser.data] == [
+            False,
+            True,
+            False,
+        ]
+        assert parser.data[1].text == []
+
+
+class TestSearchProcessor:
+    def test_omits_excluded_sections(self) -> None:
+        processor = SearchProcessor(Markdown(), SearchConfig())
+        processor.run(
+            '<h1 id="a">A</h1><p>a</p>'
+            '<h2 id="b" data-search-exclude>B</h2><p>b</p>'
+            '<h2 id="c">C</h2><p>c</p>'
+        )
+        assert [
+            (item["location"], item["text"]) for item in processor.data
+        ] == [
+            (None, "<p>a</p>"),
+            ("c", "<p>c</p>"),
+        ]
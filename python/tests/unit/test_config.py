@@ -0,0 +1,47 @@
+# Copyright (c) 2025-2026 Zensical and contributors
+
+# SPDX-License-Identifier: MIT
+# All contributions are certified under the DCO
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NON-INFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+from __future__ import annotations
+
+import yaml
+
+from zensical.config import _convert_extra
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+class TestConvertExtra:
+    def test_converts_none_values(self) -> None:
+        data = {"a": None, "b": [None, {"c": None}], "d": 1}
+        assert _convert_extra(data) == {"a": "", "b": ["", {"c": ""}], "d": 1}
+
+    def test_handles_self_referential_aliases(self) -> None:
+        data = yaml.safe_load("&a {x: *a, y: null, z: [*a, null]}")
+        converted = _convert_extra(data)
+        assert isinstance(converted, dict)
+        assert converted["x"] is converted
+        assert converted["y"] == ""
+        assert converted["z"][0] is converted
+        assert converted["z"][1] == ""
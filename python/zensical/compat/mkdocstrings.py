@@ -50,6 +50,8 @@ HANDLERS: Handlers | None = None
 class ToolConfig:
     """Mock mkdocstrings tooling configuration."""
 
+    __slots__ = ("config_file_path",)
+
     def __init__(self, config_file_path: str | None = None) -> None:
         self.config_file_path = config_file_path
 
@@ -89,10 +91,14 @@ def get_mkdocstrings_extension(
             tool_config=tool_config,
         )
 
+        # Inventories are downloaded concurrently by mkdocstrings in a thread
+        # pool, and the items are only awaited once we start consuming them.
+        # Downloads are cached on disk for a day by MkDocs' download helper,
+        # so rebuilds and subsequent runs don't hit the network again. Items
+        # are registered lazily, so downloads overlap with rendering, as the
+        # URLs are only needed once autorefs are resolved on the Rust side.
         HANDLERS._download_inventories()
-        url_map = autorefs._abs_url_map
-        for identifier, url in HANDLERS._yield_inventory_items():
-            url_map[identifier] = url
+        autorefs.register_urls(HANDLERS._yield_inventory_items())
 
     return MkdocstringsExtension(handlers=HANDLERS, autorefs=autorefs)
 
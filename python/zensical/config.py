@@ -28,6 +28,7 @@ import hashlib
 import importlib
 import os
 import pickle
+import re
 from importlib.metadata import EntryPoint, entry_points
 from importlib.util import find_spec
 from pathlib import Path
@@ -36,9 +37,8 @@ from urllib.parse import urljoin, urlparse
 
 import yaml
 from click import ClickException
-from deepmerge import always_merger
 from tomli import load as toml_load
-from yaml import Loader, YAMLError
+from yaml import YAMLError
 from yaml.constructor import ConstructorError
 
 from zensical.compat.mkdocstrings import get_mkdocstrings_extension
@@ -50,6 +50,13 @@ from zensical.extensions.macros import MacrosExtension
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from yaml import Loader
+else:
+    try:
+        from yaml import CLoader as Loader
+    except ImportError:  # pragma: no cover
+        from yaml import Loader
+
 
 # ----------------------------------------------------------------------------
 # Globals
@@ -110,6 +117,30 @@ DEFAULT_MARKDOWN_EXTENSIONS = {
 }
 
 
+DEFAULT_ICONS = {
+    "logo": "lucide/book-open",
+    "edit": "lucide/file-pen",
+    "view": "lucide/file-code-2",
+    "top": "lucide/circle-arrow-up",
+    "share": "lucide/share-2",
+    "menu": "lucide/menu",
+    "alternate": "lucide/languages",
+    "search": "lucide/search",
+    "close": "lucide/x",
+    "previous": "lucide/arrow-left",
+    "next": "lucide/arrow-right",
+}
+"""
+Default icons of the modern variant, which the classic variant leaves unset.
+"""
+
+
+COMPAT_EXTENSIONS_RE = re.compile(r"material(?:\.extensions|x)")
+"""
+Regex pattern to match Material's extension namespaces.
+"""
+
+
 # ----------------------------------------------------------------------------
 # Classes
 # ----------------------------------------------------------------------------
@@ -119,6 +150,15 @@ class ConfigurationError(ClickException):
     """Configuration resolution or validation failed."""
 
 
+class ConfigLoader(Loader):
+    """YAML loader for configuration files.
+
+    We use LibYAML's loader when available, which is significantly faster than
+    the pure Python implementation. Note that we can't use a safe loader, as
+    MkDocs configuration files may reference Python objects with tags.
+    """
+
+
 # ----------------------------------------------------------------------------
 # Functions
 # ----------------------------------------------------------------------------
@@ -171,15 +211,12 @@ def _yaml_load(source: IO) -> dict[str, Any]:
     different approach in the future, which will allow for composable and
     environment-specific configuration.
     """
-    Loader.add_constructor("!ENV", _construct_env_tag)
     try:
         config = yaml.load(
             # Compatibility shim: we remap Material's extension namespace to
             # Zensical's, and the now deprecated materialx namespace as well
-            source.read()
-            .replace("material.extensions", "zensical.extensions")
-            .replace("materialx", "zensical.extensions"),
-            Loader=Loader,  # noqa: S506
+            COMPAT_EXTENSIONS_RE.sub("zensical.extensions", source.read()),
+            Loader=ConfigLoader,  # noqa: S506
         )
     except YAMLError as e:
         raise ConfigurationError(
@@ -201,14 +238,35 @@ def _yaml_load(source: IO) -> dict[str, Any]:
             )
         with open(abspath, encoding="utf-8") as fd:
             parent = _yaml_load(fd)
-        config = always_merger.merge(parent, config)
+        config = _merge(parent, config)
 
     # Return resulting configuration
     return config
 
 
+def _merge(base: dict, other: dict) -> dict:
+    """Merge the given configuration into the base configuration.
+
+    Dictionaries are merged recursively, lists are concatenated, sets are
+    joined, and all other values are replaced. The base is modified in place.
+    """
+    for key, value in other.items():
+        current = base.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            base[key] = _merge(current, value)
+        elif isinstance(current, list) and isinstance(value, list):
+            base[key] = current + value
+        elif isinstance(current, set) and isinstance(value, set):
+            base[key] = current | value
+        else:
+            base[key] = value
+
+    # Return merged configuration
+    return base
+
+
 def _construct_env_tag(
-    loader: yaml.Loader,
+    loader: ConfigLoader,
     node: yaml.ScalarNode | yaml.SequenceNode | yaml.MappingNode,
 ) -> Any:
     """Assign value of ENV variable referenced at node.
@@ -255,6 +313,11 @@ def _construct_env_tag(
     return default
 
 
+# Register constructors once on our own loader, so we don't need to do it on
+# every load, and don't alter the loaders that PyYAML exposes globally
+ConfigLoader.add_constructor("!ENV", _construct_env_tag)
+
+
 # ----------------------------------------------------------------------------
 
 
@@ -315,9 +378,8 @@ def get_custom_theme_dir(path: str, config_path: str) -> str:
 
 
 def _yaml_load_theme_config(source: IO) -> dict[str, Any]:
-    Loader.add_constructor("!ENV", _construct_env_tag)
     try:
-        config = yaml.load(source, Loader=Loader)  # noqa: S506
+        config = yaml.load(source, Loader=ConfigLoader)  # noqa: S506
     except YAMLError as e:
         raise ConfigurationError(
             f"Encountered an error parsing the theme configuration file: {e}"
@@ -374,17 +436,17 @@ def _apply_defaults(config: dict, path: str) -> dict:
         raise ConfigurationError("Missing required setting: site_name")
 
     # Set site directory
-    set_default(config, "site_dir", "site", str)
-    if ".." in config.get("site_dir", ""):
+    site_dir = set_default(config, "site_dir", "site", str)
+    if ".." in site_dir:
         raise ConfigurationError("site_dir must not contain '..'")
 
     # Set docs directory
-    set_default(config, "docs_dir", "docs", str)
-    if ".." in config.get("docs_dir", ""):
+    docs_dir = set_default(config, "docs_dir", "docs", str)
+    if ".." in docs_dir:
         raise ConfigurationError("docs_dir must not contain '..'")
 
     # Validate that docs directory exists
-    docs_dir_path = os.path.join(project_root, config["docs_dir"])
+    docs_dir_path = os.path.join(project_root, docs_dir)
     if not os.path.isdir(docs_dir_path):
         raise ConfigurationError(
             f"Docs directory does not exist: {docs_dir_path}"
@@ -397,10 +459,10 @@ def _apply_defaults(config: dict, path: str) -> dict:
     set_default(config, "use_directory_urls", True, bool)
     set_default(config, "dev_addr", "localhost:8000", str)
     set_default(config, "copyright", None, str)
-    set_default(config, "watch", [], list)
+    watch = set_default(config, "watch", [], list)
 
     # Validate watch setting
-    if not all(isinstance(path, str) for path in config["watch"]):
+    if not all(isinstance(path, str) for path in watch):
         raise ConfigurationError("'watch' entries must be strings.")
 
     # Set defaults for versioning with mike
@@ -408,13 +470,12 @@ def _apply_defaults(config: dict, path: str) -> dict:
     set_default(config, "remote_name", "origin", str)
 
     # Set defaults for repository settings
-    set_default(config, "repo_url", None, str)
-    set_default(config, "repo_name", None, str)
+    repo_url = set_default(config, "repo_url", None, str)
+    repo_name = set_default(config, "repo_name", None, str)
     set_default(config, "edit_uri_template", None, str)
-    set_default(config, "edit_uri", None, str)
+    edit_uri = set_default(config, "edit_uri", None, str)
 
     # Set defaults for repository name settings
-    docs_dir = config.get("docs_dir")
     repo_names = {
         "github.com": "GitHub",
         "gitlab.com": "Gitlab",
@@ -425,19 +486,17 @@ def _apply_defaults(config: dict, path: str) -> dict:
         "gitlab.com": f"edit/master/{docs_dir}",
         "bitbucket.org": f"src/default/{docs_dir}",
     }
-    repo_url = config.get("repo_url")
     if repo_url:
         host = urlparse(repo_url).hostname or ""
-        if not config.get("repo_name"):
+        if not repo_name:
             if host in repo_names:
                 set_default(config, "repo_name", repo_names[host], str)
             elif host:
                 config["repo_name"] = host.split(".")[0].title()
         if host in edit_uris:
-            set_default(config, "edit_uri", edit_uris[host], str)
+            edit_uri = set_default(config, "edit_uri", edit_uris[host], str)
 
     # Remove trailing slash from edit_uri if present
-    edit_uri = config.get("edit_uri")
     if isinstance(edit_uri, str) and edit_uri.endswith("/"):
         config["edit_uri"] = edit_uri.rstrip("/")
 
@@ -447,11 +506,11 @@ def _apply_defaults(config: dict, path: str) -> dict:
         config["theme"] = {"name": theme}
 
     # Set defaults for custom theme directory
-    set_default(config["theme"], "custom_dir", None, str)
+    custom_dir = set_default(config["theme"], "custom_dir", None, str)
 
     # Load theme configuration
-    if config["theme"].get("custom_dir"):
-        theme_dir = get_custom_theme_dir(config["theme"]["custom_dir"], path)
+    if custom_dir:
+        theme_dir = get_custom_theme_dir(custom_dir, path)
         theme_config, theme_dirs = _load_theme_config(theme_dir)
         if (
             len(theme_dirs) == 1
@@ -483,8 +542,8 @@ def _apply_defaults(config: dict, path: str) -> dict:
     set_default(theme, "name", None, str)
 
     # Set variant and fonts for variant
-    set_default(theme, "variant", "modern", str)
-    if theme.get("variant") == "modern":
+    variant = set_default(theme, "variant", "modern", str)
+    if variant == "modern":
         font = {"text": "Inter", "code": "JetBrains Mono"}
     else:
         font = {"text": "Roboto", "code": "Roboto Mono"}
@@ -500,40 +559,18 @@ def _apply_defaults(config: dict, path: str) -> dict:
     set_default(theme, "logo", None, str)
 
     # Set defaults for theme font settings
-    theme.setdefault("font", {})
-    if isinstance(theme["font"], dict):
-        set_default(theme["font"], "text", font["text"], str)
-        set_default(theme["font"], "code", font["code"], str)
+    theme_font = theme.setdefault("font", {})
+    if isinstance(theme_font, dict):
+        set_default(theme_font, "text", font["text"], str)
+        set_default(theme_font, "code", font["code"], str)
 
     # Set defaults for theme icons
     icon = set_default(theme, "icon", {}, dict)
     set_default(icon, "repo", None, str)
     set_default(icon, "annotation", None, str)
     set_default(icon, "tag", {}, dict)
-    if theme.get("variant") == "modern":
-        set_default(icon, "logo", "lucide/book-open", str)
-        set_default(icon, "edit", "lucide/file-pen", str)
-        set_default(icon, "view", "lucide/file-code-2", str)
-        set_default(icon, "top", "lucide/circle-arrow-up", str)
-        set_default(icon, "share", "lucide/share-2", str)
-        set_default(icon, "menu", "lucide/menu", str)
-        set_default(icon, "alternate", "lucide/languages", str)
-        set_default(icon, "search", "lucide/search", str)
-        set_default(icon, "close", "lucide/x", str)
-        set_default(icon, "previous", "lucide/arrow-left", str)
-        set_default(icon, "next", "lucide/arrow-right", str)
-    else:
-        set_default(icon, "logo", None, str)
-        set_default(icon, "edit", None, str)
-        set_default(icon, "view", None, str)
-        set_default(icon, "top", None, str)
-        set_default(icon, "share", None, str)
-        set_default(icon, "menu", None, str)
-        set_default(icon, "alternate", None, str)
-        set_default(icon, "search", None, str)
-        set_default(icon, "close", None, str)
-        set_default(icon, "previous", None, str)
-        set_default(icon, "next", None, str)
+    for key, value in DEFAULT_ICONS.items():
+        set_default(icon, key, value if variant == "modern" else None, str)
 
     # Set defaults for theme admonition icons
     admonition = set_default(icon, "admonition", {}, dict)
@@ -701,34 +738,40 @@ def set_default(
 
     Optionally cast it to the specified data type.
     """
-    if key in entry and entry[key] is None:
-        del entry[key]
-
-    # Set the default value if the key is not present
-    entry.setdefault(key, default)
-
-    # Optionally cast the value to the specified data type
-    if data_type is not None and entry[key] is not None:
+    value = entry.get(key)
+
+    # Set the default value if the key is not present or set to `None`
+    if value is None:
+        value = entry[key] = default
+
+    # Optionally cast the value to the specified data type, unless it already
+    # is of that type, which is the common case and saves us copying it
+    if (
+        data_type is not None
+        and value is not None
+        and type(value) is not data_type
+    ):
         try:
-            entry[key] = data_type(entry[key])
+            value = entry[key] = data_type(value)
         except (ValueError, TypeError) as e:
             raise ValueError(
                 f"Failed to cast key '{key}' to {data_type}: {e}"
             ) from e
 
     # Return the resulting value
-    return entry[key]
+    return value
 
 
 def _hash(data: Any) -> int:
     """Compute a hash for the given data."""
-    hash = hashlib.sha1(pickle.dumps(data))  # noqa: S324
-    return int(hash.hexdigest(), 16) % (2**64)
+    hash = hashlib.blake2b(pickle.dumps(data), digest_size=8)
+    return int.from_bytes(hash.digest(), "big")
 
 
 # ----------------------------------------------------------------------------
 
 
+@functools.cache
 def _resolve(symbol: str) -> Any:
     """Resolve a symbol to its corresponding Python object."""
     module_path, func_name = symbol.rsplit(".", 1)
@@ -1001,76 +1044,86 @@ def _is_index(path: str) -> bool:
 
 
 def _convert_nav(nav: list) -> list:
-    """Convert MkDocs navigation."""
-    return [_convert_nav_item(entry) for entry in nav]
+    """Convert MkDocs navigation.
+
+    Navigation is converted iteratively, so that deeply nested structures don't
+    incur the overhead of recursion, or run into Python's recursion limit.
+    """
+    result: list = []
+    stack: list[tuple[list, list]] = [(nav, result)]
+    while stack:
+        items, converted = stack.pop()
+        for item in items:
+            if isinstance(item, list):
+                children: list = []
+                stack.append((item, children))
+                converted.append(children)
+            else:
+                entry, nested = _convert_nav_item(item)
+                if nested is not None:
+                    stack.append((nested, entry["children"]))
+                converted.append(entry)
 
+    # Return converted navigation
+    return result
 
-def _convert_nav_item(item: str | dict | list) -> dict | list:
+
+def _convert_nav_item(item: str | dict) -> tuple[dict, list | None]:
     """Convert MkDocs shorthand navigation structure into something manageable.
 
-    We need to annotate each item with a title, URL, icon, and children.
+    We need to annotate each item with a title, URL, icon, and children. Nested
+    items are returned alongside the item, and must be converted by the caller.
     """
+    entry: dict[str, Any] = {
+        "title": None,
+        "url": None,
+        "canonical_url": None,
+        "meta": None,
+        "children": [],
+        "is_index": False,
+        "active": False,
+    }
+
+    # Handle URL
     if isinstance(item, str):
-        return {
-            "title": None,
-            "url": item,
-            "canonical_url": None,
-            "meta": None,
-            "children": [],
-            "is_index": _is_index(item),
-            "active": False,
-        }
+        entry["url"] = item
+        entry["is_index"] = _is_index(item)
+        return entry, None
 
-    # Handle Title: URL
+    # Handle Title: URL and Title: [...]
     if isinstance(item, dict):
         for title, value in item.items():
+            entry["title"] = str(title)
             if isinstance(value, str):
-                return {
-                    "title": str(title),
-                    "url": value.strip(),
-                    "canonical_url": None,
-                    "meta": None,
-                    "children": [],
-                    "is_index": _is_index(value.strip()),
-                    "active": False,
-                }
+                entry["url"] = url = value.strip()
+                entry["is_index"] = _is_index(url)
+                return entry, None
             if isinstance(value, list):
-                return {
-                    "title": str(title),
-                    "url": None,
-                    "canonical_url": None,
-                    "meta": None,
-                    "children": [_convert_nav_item(child) for child in value],
-                    "is_index": False,
-                    "active": False,
-                }
+                return entry, value
             raise TypeError(f"Unknown nav item value type: {type(value)}")
 
-    # Handle a list of items
-    elif isinstance(item, list):
-        return [_convert_nav_item(child) for child in item]
-
     raise TypeError(f"Unknown nav item type: {type(item)}")
 
 
 def _convert_extra(data: dict | list) -> dict | list:
-    """Recursively convert None values in a dictionary/list to empty strings."""
-    if isinstance(data, dict):
-        # Process each key-value pair in the dictionary
-        return {
-            key: _convert_extra(value)
-            if isinstance(value, (dict, list))
-            else ("" if value is None else value)
-            for key, value in data.items()
-        }
-    if isinstance(data, list):
-        # Process each item in the list
-        return [
-            _convert_extra(item)
-            if isinstance(item, (dict, list))
-            else ("" if item is None else item)
-            for item in data
-        ]
+    """Convert None values in a dictionary/list to empty strings, in place.
+
+    Containers are visited only once, as YAML aliases can make the same
+    container appear multiple times, or even inside itself.
+    """
+    stack = [data]
+    seen = {id(data)}
+    while stack:
+        node = stack.pop()
+        items = node.items() if isinstance(node, dict) else enumerate(node)
+        for key, value in items:
+            if value is None:
+                node[key] = ""
+            elif isinstance(value, (dict, list)) and id(value) not in seen:
+                seen.add(id(value))
+                stack.append(value)
+
+    # Return converted data
     return data
 
 
@@ -1143,7 +1196,7 @@ def _convert_markdown_extensions(value: Any) -> tuple[list[str], dict]:
                 markdown_extensions.append(item)
 
     # Return extension list and configuration, after ensuring they're unique
-    return list(set(markdown_extensions)), mdx_configs
+    return list(dict.fromkeys(markdown_extensions)), mdx_configs
 
 
 def _convert_plugins(value: Any, config: dict) -> dict:
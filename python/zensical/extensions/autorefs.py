@@ -23,9 +23,12 @@
 
 from __future__ import annotations
 
+import logging
 import re
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cache
 from html import escape
 from typing import TYPE_CHECKING, Any
 from xml.etree.ElementTree import Element
@@ -44,6 +47,7 @@ from markupsafe import Markup
 from zensical.extensions.context import ContextPreprocessor
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
     from re import Match
 
@@ -62,13 +66,7 @@ AUTOREF_RE = re.compile(
     r"<autoref (?P<attrs>.*?)>(?P<title>.*?)</autoref>", flags=re.DOTALL
 )
 
-
-# ----------------------------------------------------------------------------
-# Globals
-# ----------------------------------------------------------------------------
-
-
-AUTOREFS: AutorefsStore | None = None
+_logger = logging.getLogger(__name__)
 
 
 # ----------------------------------------------------------------------------
@@ -79,6 +77,22 @@ AUTOREFS: AutorefsStore | None = None
 class AutorefsStore:
     """Mock the autorefs plugin (data store)."""
 
+    __slots__ = (
+        "_abs_url_map",
+        "_anchor_prefix",
+        "_anchor_prefix_page",
+        "_data_view",
+        "_pending_urls",
+        "_primary_url_map",
+        "_secondary_url_map",
+        "_title_map",
+        "_url_maps",
+        "_url_sets",
+        "current_page",
+        "record_backlinks",
+        "scan_toc",
+    )
+
     def __init__(self) -> None:
         self.current_page: Page | None = None
         self.scan_toc: bool = True
@@ -89,6 +103,33 @@ class AutorefsStore:
         self._abs_url_map: dict[str, str] = {}
         self._title_map: dict[str, str] = {}
 
+        # Prefix for anchor URLs of the page they were last registered for,
+        # computed once per page, as it's used for every anchor on the page
+        self._anchor_prefix_page: Page | None = None
+        self._anchor_prefix = ""
+
+        # Absolute URLs that are registered lazily, e.g., from inventories that
+        # are still being downloaded, and consumed when data is requested
+        self._pending_urls: list[Iterable[tuple[str, str]]] = []
+
+        # Maps indexed by whether anchors are primary, for lookups without
+        # branching in the registration hot path. Each map is accompanied by
+        # a set of registered identifier and URL pairs, so duplicate checks
+        # don't need to scan the lists, which must be kept for their order
+        # and for Rust. Most identifiers map to a single URL, so a flat set is
+        # much leaner than a set for each identifier.
+        self._url_maps = (self._secondary_url_map, self._primary_url_map)
+        self._url_sets: tuple[set[tuple[str, str]], ...] = (set(), set())
+
+        # Data handed to Rust, which references the live maps, so it can be
+        # created once and doesn't need to be rebuilt for every request
+        self._data_view: dict[str, Any] = {
+            "primary": self._primary_url_map,
+            "secondary": self._secondary_url_map,
+            "inventory": self._abs_url_map,
+            "titles": self._title_map,
+        }
+
     def register_anchor(
         self,
         page: Page,
@@ -98,19 +139,65 @@ class AutorefsStore:
         title: str | None = None,
         primary: bool = True,
     ) -> None:
-        url = f"{page.url}#{anchor or identifier}"
-        url_map = self._primary_url_map if primary else self._secondary_url_map
-        if identifier in url_map:
-            if url not in url_map[identifier]:
-                url_map[identifier].append(url)
-        else:
-            url_map[identifier] = [url]
-        if title and url not in self._title_map:
-            self._title_map[url] = title
+        if page is not self._anchor_prefix_page:
+            self._anchor_prefix_page = page
+            self._anchor_prefix = sys.intern(f"{page.url}#")
+
+        # Identifiers recur across pages, so interning them (and their URLs)
+        # shares storage and lets dictionary lookups compare by identity. Only
+        # exact strings can be interned, so subclasses like `Markup` are
+        # converted first, which formatting the URL does implicitly
+        identifier = sys.intern(str(identifier))
+        url = sys.intern(f"{self._anchor_prefix}{anchor or identifier}")
+        url_set, key = self._url_sets[primary], (identifier, url)
+        if key not in url_set:
+            url_set.add(key)
+            self._url_maps[primary].setdefault(identifier, []).append(url)
+        if title:
+            self._title_map.setdefault(url, title)
 
     def register_url(self, identifier: str, url: str) -> None:
+        """Register an absolute URL, replacing any previous one.
+
+        Later registrations must win, since mkdocstrings yields inventory
+        items in reverse order, so that earlier inventories take precedence.
+        """
         self._abs_url_map[identifier] = url
 
+    def register_urls(self, items: Iterable[tuple[str, str]]) -> None:
+        """Register absolute URLs lazily.
+
+        The given items are only consumed when the data is requested, so that
+        e.g. inventory downloads can overlap with rendering.
+        """
+        self._pending_urls.append(items)
+
+    def load_pending_urls(self) -> None:
+        """Consume all lazily registered absolute URLs.
+
+        Errors raised while consuming items, e.g., when an inventory can't be
+        downloaded or parsed, are logged, so that all other data is kept.
+        """
+        while self._pending_urls:
+            items = self._pending_urls.pop(0)
+            try:
+                self._abs_url_map.update(items)
+            except Exception:
+                _logger.exception("Couldn't load absolute URLs")
+
+    def clear(self) -> None:
+        """Clear all registered data, keeping the allocated containers."""
+        self.current_page = None
+        self._anchor_prefix_page = None
+        for container in (
+            *self._url_maps,
+            *self._url_sets,
+            self._abs_url_map,
+            self._title_map,
+            self._pending_urls,
+        ):
+            container.clear()
+
 
 # Unusued yet, only when/if we vendor mkdocstrings and handlers
 class AutorefsHookInterface(ABC):
@@ -272,10 +359,9 @@ class AutorefsAnchorsTreeprocessor(Treeprocessor):
         def flush(
             self, alias_to: str | None = None, title: str | None = None
         ) -> None:
+            register_anchor, page = self.store.register_anchor, self.page
             for anchor in self.anchors:
-                self.store.register_anchor(
-                    self.page, anchor, alias_to, title=title, primary=True
-                )
+                register_anchor(page, anchor, alias_to, title=title)
             self.anchors.clear()
 
     def __init__(self, md: Markdown) -> None:
@@ -397,12 +483,10 @@ class AutorefsExtension(Extension):
 # ----------------------------------------------------------------------------
 
 
+@cache
 def get_autorefs_store() -> AutorefsStore:
     """Get the global autorefs instance."""
-    global AUTOREFS  # noqa: PLW0603
-    if AUTOREFS is None:
-        AUTOREFS = AutorefsStore()
-    return AUTOREFS
+    return AutorefsStore()
 
 
 def get_autorefs_data() -> dict[str, Any]:
@@ -413,14 +497,9 @@ def get_autorefs_data() -> dict[str, Any]:
     Markdown extension (for manual cross-references) and the
     mkdocstrings extension (for automatic cross-references).
     """
-    if AUTOREFS:
-        return {
-            "primary": AUTOREFS._primary_url_map,
-            "secondary": AUTOREFS._secondary_url_map,
-            "inventory": AUTOREFS._abs_url_map,
-            "titles": AUTOREFS._title_map,
-        }
-    return {}
+    store = get_autorefs_store()
+    store.load_pending_urls()
+    return store._data_view
 
 
 def set_autorefs_page(page: Page) -> None:
@@ -431,8 +510,7 @@ def set_autorefs_page(page: Page) -> None:
 
 def reset() -> None:
     """Reset global state in-between rebuilds."""
-    global AUTOREFS  # noqa: PLW0603
-    AUTOREFS = None
+    get_autorefs_store().clear()
 
 
 def makeExtension(**kwargs: Any) -> AutorefsExtension:
@@ -25,13 +25,14 @@ from __future__ import annotations
 
 import functools
 import os
-from glob import iglob
 from typing import TYPE_CHECKING
 from xml.etree.ElementTree import Element
 
 from pymdownx import emoji, twemoji_db
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from markdown import Markdown
 
 # -----------------------------------------------------------------------------
@@ -92,6 +93,9 @@ def _load_twemoji_index(paths: tuple[str, ...]) -> dict:
         "aliases": twemoji_db.aliases,
     }
 
+    # Keep references to the emoji and aliases for fast lookups
+    emojis, aliases = index["emoji"], index["aliases"]
+
     # Compute path to theme root and traverse all icon directories
     root = os.path.dirname(os.path.dirname(__file__))
     root = os.path.join(root, "templates", ".icons")
@@ -99,15 +103,41 @@ def _load_twemoji_index(paths: tuple[str, ...]) -> dict:
         base = os.path.normpath(path)
 
         # Index icons provided by the theme and via custom icons
-        glob = os.path.join(base, "**", "*.svg")
-        svgs = iglob(os.path.normpath(glob), recursive=True)
-        for file in svgs:
+        for file in _walk_svgs(base):
             icon = file[len(base) + 1 : -4].replace(os.path.sep, "-")
 
             # Add icon to index
             name = f":{icon}:"
-            if not any(name in index[key] for key in ["emoji", "aliases"]):
-                index["emoji"][name] = {"name": name, "path": file}
+            if name not in emojis and name not in aliases:
+                emojis[name] = {"name": name, "path": file}
 
     # Return index
     return index
+
+
+def _walk_svgs(base: str) -> Iterator[str]:
+    """Yield paths of all SVG files below the given directory.
+
+    Directories are traversed depth-first in the same order as a recursive
+    glob, including skipping of hidden files and directories, but without
+    the additional `stat` calls, as directory entries already know their type.
+    """
+    stack = [base]
+    while stack:
+        dirs: list[str] = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+
+                    # Collect directories, and yield SVG files right away
+                    if entry.is_dir():
+                        dirs.append(entry.path)
+                    elif entry.name.endswith(".svg"):
+                        yield entry.path
+        except OSError:
+            continue
+
+        # Descend into subdirectories in the order they were encountered
+        stack.extend(reversed(dirs))
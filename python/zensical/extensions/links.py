@@ -24,7 +24,6 @@
 from __future__ import annotations
 
 import re
-from pathlib import PurePosixPath
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
@@ -50,6 +49,9 @@ _RE = re.compile(
 )
 """Match `href` and `src` attribute values in stashed raw HTML blocks."""
 
+_PLAIN_RE = re.compile(r"[^:;?#\s\x00-\x1f]+")
+"""Match plain paths without scheme, params, query, fragment or specials."""
+
 
 # -----------------------------------------------------------------------------
 # Classes
@@ -74,14 +76,14 @@ class LinksTreeprocessor(Treeprocessor):
         for el in root.iter():
             # In case the element has a `href` or `src` attribute, we parse it
             # as an URL, so we can analyze and alter its path
-            key = next((k for k in ("href", "src") if el.get(k)), None)
-            if not key:
-                continue
+            key = "href"
+            if not (value := el.get(key)):
+                key = "src"
+                if not (value := el.get(key)):
+                    continue
 
             # Rewrite relative links, leaving absolute URLs unchanged
-            if url := _rewrite_url(
-                el.get(key, ""), self.path, self.use_directory_urls
-            ):
+            if url := _rewrite_url(value, self.path, self.use_directory_urls):
                 el.set(key, url)
 
 
@@ -181,8 +183,7 @@ def makeExtension(**kwargs: Any) -> LinksExtension:
 
 def _get_name(value: str) -> str:
     """Return the filename component of a POSIX-style path."""
-    path = PurePosixPath(value)
-    return path.name
+    return value.rpartition("/")[2]
 
 
 def _is_relative(value: str) -> bool:
@@ -235,8 +236,7 @@ def _apply_directory_prefix(
     value: str, path: str, use_directory_urls: bool
 ) -> str:
     """Prepend `../` for non-index pages when directory URLs are enabled."""
-    is_index = _get_name(path) in ("index.md", "README.md")
-    if not is_index and use_directory_urls:
+    if use_directory_urls and _get_name(path) not in ("index.md", "README.md"):
         return f"../{value}"
 
     # No change needed
@@ -245,6 +245,25 @@ def _apply_directory_prefix(
 
 def _rewrite_url(value: str, path: str, use_directory_urls: bool) -> str | None:
     """Rewrite a relative URL."""
+    # Fast path: plain relative paths can be rewritten without parsing, which
+    # is the most common case, so we only need to check for absolute paths
+    if _PLAIN_RE.fullmatch(value):
+        if value.startswith("/"):
+            return None
+
+        # Rewrite the path, as there are no other components to preserve
+        value = _md_path_to_html(value, use_directory_urls)
+        return _apply_directory_prefix(value, path, use_directory_urls)
+
+    # Otherwise, parse the URL, so all other components are preserved
+    return _rewrite_parsed_url(value, path, use_directory_urls)
+
+
+def _rewrite_parsed_url(
+    value: str, path: str, use_directory_urls: bool
+) -> str | None:
+    """Rewrite a relative URL by parsing it."""
+    # Skip absolute URLs and anchor-only references
     if not _is_relative(value):
         return None
 
@@ -23,10 +23,10 @@
 
 from __future__ import annotations
 
-import posixpath
+import functools
+import re
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
-from urllib.parse import urlparse
 
 from markdown import Extension
 from markdown.treeprocessors import Treeprocessor
@@ -39,6 +39,25 @@ if TYPE_CHECKING:
 
     from markdown import Markdown
 
+# -----------------------------------------------------------------------------
+# Constants
+# -----------------------------------------------------------------------------
+
+
+_EXTERNAL_RE = re.compile(
+    r"(?:[a-z][a-z0-9+.-]*:|//[^/?#])", re.ASCII | re.IGNORECASE
+)
+"""Match URLs with a scheme or non-empty network location, like `urlsplit`."""
+
+_UNSAFE_CHARS = str.maketrans("", "", "\t\r\n")
+"""Translation table to remove tab and newline characters, like `urlsplit`."""
+
+_LEADING_CHARS = "".join(map(chr, range(0x21)))
+"""Control characters and spaces stripped from the start, like `urlsplit`."""
+
+_SKIP_RE = re.compile(r"footnote-(?:back)?ref|headerlink")
+"""Match classes of footnote references, footnote backrefs and headerlinks."""
+
 # -----------------------------------------------------------------------------
 # Classes
 # -----------------------------------------------------------------------------
@@ -70,6 +89,10 @@ class PreviewProcessor(Treeprocessor):
         super().__init__(md)
         self.config = config
 
+        # Source and target filters, shared by all processors with the same
+        # configuration, as a new processor is created for every page
+        self.filters = _get_filters(config)
+
     def run(self, root: Element) -> None:
         """Run the treeprocessor."""
         at = self.md.treeprocessors.get_index_for_name(LinksTreeprocessor.name)
@@ -87,57 +110,37 @@ class PreviewProcessor(Treeprocessor):
         if not isinstance(processor, LinksTreeprocessor):
             raise TypeError("Links processor not registered")
 
-        # Normalize configurations
-        configurations = list(self.config.configurations)
-        configurations.append(
-            {
-                "sources": self.config.sources,
-                "targets": self.config.targets,
-            }
-        )
+        # Collect target filters of all configurations that consider the page
+        page = processor.path
+        filters = [
+            targets for sources, targets in self.filters if sources(page)
+        ]
 
-        # Walk through all configurations - @todo refactor so that we don't
-        # iterate multiple times over the same elements
-        for configuration in configurations:
-            if not configuration.get("sources") and not configuration.get(
-                "targets"
-            ):
-                continue
+        # Skip if no configuration considers the page
+        if not filters:
+            return
 
-            # Skip if page should not be considered
-            filter = get_filter(configuration, "sources")
-            if not filter(processor.path):
+        # Walk through all links once and add preview attributes
+        for el in root.iter("a"):
+            href = el.get("href")
+            if not href:
                 continue
 
-            # Walk through all links and add preview attributes
-            filter = get_filter(configuration, "targets")
-            for el in root.iter("a"):
-                href = el.get("href")
-                if not href:
-                    continue
-
-                # Skip footnotes
-                if "footnote-ref" in el.get("class", ""):
-                    continue
-                if "footnote-backref" in el.get("class", ""):
-                    continue
-
-                # Skip headerlinks
-                if "headerlink" in el.get("class", ""):
-                    continue
+            # Skip footnotes and headerlinks
+            if _SKIP_RE.search(el.get("class", "")):
+                continue
 
-                # Skip external links
-                url = urlparse(href)
-                if url.scheme or url.netloc:
-                    continue
+            # Skip external links
+            if _is_external(href):
+                continue
 
-                # An empty url.path means we're targetting the current page
-                url_path = url.path or processor.path
+            # An empty path means we're targetting the current page
+            url_path = _get_path(href) or page
 
-                # Include, if filter matches
-                path = resolve(processor.path, url_path)
-                if path and filter(path):
-                    el.set("data-preview", "")
+            # Include, if any filter matches
+            path = resolve(page, url_path)
+            if path and any(filter(path) for filter in filters):
+                el.set("data-preview", "")
 
 
 # -----------------------------------------------------------------------------
@@ -183,15 +186,13 @@ def get_filter(settings: dict, key: str) -> Filter:
 
 def resolve(processor_path: str, url_path: str) -> str:
     """Resolve a relative URL path against the processor path."""
-    # Remove the file name from the processor path to get the directory
-    base_path = posixpath.dirname(processor_path)
-
-    # Split the base path and URL path into segments
-    base_segments = base_path.split("/")
-    url_segments = url_path.split("/")
+    # Remove the file name from the processor path to get the directory, and
+    # split it into segments, omitting empty segments just like joining does
+    base_path = processor_path.rpartition("/")[0]
+    base_segments = [segment for segment in base_path.split("/") if segment]
 
     # Process each segment in the URL path
-    for segment in url_segments:
+    for segment in url_path.split("/"):
         if segment == "..":
             # Remove the last segment from the base path if possible
             if base_segments:
@@ -201,7 +202,88 @@ def resolve(processor_path: str, url_path: str) -> str:
             base_segments.append(segment)
 
     # Join the base segments into the resolved path
-    return posixpath.join(*base_segments)
+    return "/".join(base_segments)
+
+
+def _get_filters(config: PreviewConfig) -> tuple[tuple[Filter, Filter], ...]:
+    """Get source and target filters of all configurations."""
+    configurations = list(config.configurations)
+    configurations.append(
+        {
+            "sources": config.sources,
+            "targets": config.targets,
+        }
+    )
+
+    # Freeze source and target settings, so they can be used as a cache key
+    return _create_filters(
+        tuple(
+            (
+                _freeze(configuration.get("sources", {})),
+                _freeze(configuration.get("targets", {})),
+            )
+            for configuration in configurations
+        )
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _create_filters(
+    configurations: tuple[tuple[Any, Any], ...],
+) -> tuple[tuple[Filter, Filter], ...]:
+    """Create source and target filters from frozen settings.
+
+    Filters are cached by the settings themselves, since a new processor is
+    created for every page, so a reloaded configuration with changed settings
+    results in new filters, while unused filters are eventually evicted.
+    """
+    filters: list[tuple[Filter, Filter]] = []
+    for sources, targets in configurations:
+        if not sources and not targets:
+            continue
+
+        # Append source and target filter
+        filters.append(
+            (
+                Filter(config=dict(sources)),
+                Filter(config=dict(targets)),
+            )
+        )
+
+    # Return filters
+    return tuple(filters)
+
+
+def _freeze(value: Any) -> Any:
+    """Freeze settings, turning dictionaries and lists into tuples."""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@functools.lru_cache(maxsize=8192)
+def _is_external(href: str) -> bool:
+    """Check whether a URL has a scheme or network location."""
+    return _EXTERNAL_RE.match(_normalize(href)) is not None
+
+
+def _get_path(href: str) -> str:
+    """Return the path component of a URL without scheme or network location."""
+    path = _normalize(href).partition("#")[0].partition("?")[0]
+
+    # Remove the empty network location, e.g., of `///path`
+    path = path.removeprefix("//")
+
+    # Remove parameters from the last path segment, like `urlparse` does
+    index = path.find(";", max(path.rfind("/"), 0))
+    return path[:index] if index >= 0 else path
+
+
+def _normalize(href: str) -> str:
+    """Remove characters from a URL that `urlsplit` ignores."""
+    return href.translate(_UNSAFE_CHARS).lstrip(_LEADING_CHARS)
 
 
 def makeExtension(**kwargs: Any) -> PreviewExtension:
@@ -127,6 +127,8 @@ class Element:
     parser to access attributes in other callbacks than handle_starttag.
     """
 
+    __slots__ = ("attrs", "tag")
+
     # Initialize HTML element
     def __init__(
         self, tag: str, attrs: dict[str, str | None] | None = None
@@ -138,16 +140,6 @@ class Element:
     def __repr__(self):
         return self.tag
 
-    # Support comparison (compare by tag only)
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, Element):
-            return self.tag == other.tag
-        return self.tag == other
-
-    # Support set operations
-    def __hash__(self):
-        return hash(self.tag)
-
     # Check whether the element should be excluded
     def is_excluded(self) -> bool:
         return "data-search-exclude" in self.attrs
@@ -164,6 +156,8 @@ class Section:
     headline with a certain level (h1-h6). Internally used by the parser.
     """
 
+    __slots__ = ("depth", "el", "excluded", "id", "level", "text", "title")
+
     # Initialize HTML section
     def __init__(self, el: Element, level: int, depth: int = 0) -> None:
         self.el = el
@@ -175,6 +169,9 @@ class Section:
         self.title: list[str] = []
         self.id: str | None = None
 
+        # Determine whether the section is excluded, since we check it often
+        self.excluded = el.is_excluded()
+
     # String representation
     def __repr__(self):
         if self.id:
@@ -183,7 +180,7 @@ class Section:
 
     # Check whether the section should be excluded
     def is_excluded(self) -> bool:
-        return self.el.is_excluded()
+        return self.excluded
 
 
 # -----------------------------------------------------------------------------
@@ -203,17 +200,16 @@ class Parser(HTMLParser):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
-        # Tags to skip
-        self.skip: set[str | Element] = {
-            "object",  # Objects
-            "script",  # Scripts
-            "style",  # Styles
-        }
-
-        # Current context and section
+        # Current context, its tags, and skipped elements within the context -
+        # tags are kept separately, so we can check them without comparisons
         self.context: list[Element] = []
+        self.tags: list[str] = []
+        self.skipped: list[Element] = []
         self.section: Section | None = None
 
+        # Positions of rendered opening tags of elements in the current context
+        self.marks: list[tuple[list[str], int]] = []
+
         # All parsed sections
         self.data: list[Section] = []
 
@@ -221,17 +217,18 @@ class Parser(HTMLParser):
     def handle_starttag(
         self, tag: str, attrs: list[tuple[str, str | None]]
     ) -> None:
-        attrs_dict = dict(attrs)
+        # Ignore self-closing tags, before doing any other work
+        if tag in void:
+            return
 
-        # Ignore self-closing tags
+        # Create element and add it to the current context
+        attrs_dict = dict(attrs)
         el = Element(tag, attrs_dict)
-        if tag not in void:
-            self.context.append(el)
-        else:
-            return
+        self.context.append(el)
+        self.tags.append(tag)
 
         # Handle heading
-        if tag in ([f"h{x}" for x in range(1, 7)]):
+        if tag in headings:
             depth = len(self.context)
             if "id" in attrs_dict:
                 # Ensure top-level section
@@ -252,31 +249,37 @@ class Parser(HTMLParser):
             self.section = Section(Element("hx"), 1)
             self.data.append(self.section)
 
+        # Skip tags that are never part of the index
+        if tag in skip:
+            self.skipped.append(el)
+            return
+
         # Handle special cases to skip
         for key, value in attrs_dict.items():
             # Skip block if explicitly excluded from search
             if key == "data-search-exclude":
-                self.skip.add(el)
+                self.skipped.append(el)
                 return
 
             # Skip line numbers - see https://bit.ly/3GvubZx
             if key == "class" and value == "linenodiv":
-                self.skip.add(el)
+                self.skipped.append(el)
                 return
 
         # Render opening tag if kept
-        if not self.skip.intersection(self.context) and tag in keep:
+        if not self.skipped and tag in keep:
             # Check whether we're inside the section title
             data = self.section.text
-            if self.section.el in self.context:
+            if self.section.el.tag in self.tags:
                 data = self.section.title
 
-            # Append to section title or text
+            # Append to section title or text, and remember the position
+            self.marks.append((data, len(data)))
             data.append(f"<{tag}>")
 
     # Called at the end of every HTML tag
     def handle_endtag(self, tag: str) -> None:
-        if not self.context or self.context[-1] != tag:
+        if not self.tags or self.tags[-1] != tag:
             return
 
         # Check whether we're exiting the current context, which happens when
@@ -293,43 +296,45 @@ class Parser(HTMLParser):
                     self.section = section
                     break
 
-        # Remove element from skip list
+        # Remove element from skipped elements - since skipped elements are part
+        # of the context, they are always removed in the order they were added
         el = self.context.pop()
-        if el in self.skip:
-            if el.tag not in ["script", "style", "object"]:
-                self.skip.remove(el)
+        self.tags.pop()
+        if self.skipped and self.skipped[-1] is el:
+            self.skipped.pop()
             return
 
         # Render closing tag if kept
-        if not self.skip.intersection(self.context) and tag in keep:
+        if not self.skipped and tag in keep:
             # Check whether we're inside the section title
             data = self.section.text
-            if self.section.el in self.context:
+            if self.section.el.tag in self.tags:
                 data = self.section.title
 
-            # Search for corresponding opening tag
-            index = data.index(f"<{tag}>")
+            # Retrieve position of corresponding opening tag - if it was added
+            # somewhere else, e.g., before a nested section, just close it
+            marked, index = self.marks.pop()
+            if marked is not data:
+                data.append(f"</{tag}>")
+                return
+
+            # Append to section title or text, if not empty
             for i in range(index + 1, len(data)):
                 if not data[i].isspace():
-                    index = len(data)
+                    data.append(f"</{tag}>")
                     break
 
             # Remove element if empty (or only whitespace)
-            if len(data) > index:
-                while len(data) > index:
-                    data.pop()
-
-            # Append to section title or text
             else:
-                data.append(f"</{tag}>")
+                del data[index:]
 
     # Called for the text contents of each tag
     def handle_data(self, data: str) -> None:
-        if self.skip.intersection(self.context):
+        if self.skipped:
             return
 
         # Collapse whitespace in non-pre contexts
-        if "pre" not in self.context:
+        if "pre" not in self.tags:
             if not data.isspace():
                 data = data.replace("\n", " ")
             else:
@@ -340,8 +345,12 @@ class Parser(HTMLParser):
             self.section = Section(Element("hx"), 1)
             self.data.append(self.section)
 
+        # Skip text of excluded sections, as it's discarded anyway
+        if self.section.excluded:
+            return
+
         # Handle section headline
-        if self.section.el in self.context:
+        if self.section.el.tag in self.tags:
             permalink = False
             for el in self.context:
                 if el.tag == "a" and el.attrs.get("class") == "headerlink":
@@ -356,7 +365,7 @@ class Parser(HTMLParser):
             if (
                 not self.section.text
                 or not self.section.text[-1].isspace()
-                or "pre" in self.context
+                or "pre" in self.tags
             ):
                 self.section.text.append(data)
 
@@ -370,6 +379,16 @@ class Parser(HTMLParser):
 # -----------------------------------------------------------------------------
 
 
+# Tags that are headings
+headings = {"h1", "h2", "h3", "h4", "h5", "h6"}
+
+# Tags to skip
+skip = {
+    "object",  # Objects
+    "script",  # Scripts
+    "style",  # Styles
+}
+
 # Tags to keep
 keep = {
     "p",
@@ -23,7 +23,9 @@
 
 from __future__ import annotations
 
-from fnmatch import fnmatch
+import os
+import re
+from fnmatch import translate
 
 # -----------------------------------------------------------------------------
 # Classes
@@ -41,6 +43,15 @@ class Filter:
         """
         self.config = config
 
+        # Compile inclusion and exclusion patterns once, so that each value is
+        # matched against all patterns of a kind with a single regex match
+        self._include = (
+            _compile(config["include"]) if "include" in config else None
+        )
+        self._exclude = (
+            _compile(config["exclude"]) if "exclude" in config else None
+        )
+
     def __call__(self, value: str) -> bool:
         """Filter a value.
 
@@ -55,24 +66,14 @@ class Filter:
         Returns:
             Whether the value should be included.
         """
-        # Check if value matches one of the inclusion patterns
-        if "include" in self.config:
-            for pattern in self.config["include"]:
-                if fnmatch(value, pattern):
-                    break
+        value = os.path.normcase(value)
 
-            # Value is not included
-            else:
-                return False
+        # Check if value matches one of the inclusion patterns
+        if self._include is not None and not self._include.match(value):
+            return False
 
         # Check if value matches one of the exclusion patterns
-        if "exclude" in self.config:
-            for pattern in self.config["exclude"]:
-                if fnmatch(value, pattern):
-                    return False
-
-        # Value is not excluded
-        return True
+        return self._exclude is None or not self._exclude.match(value)
 
     # -------------------------------------------------------------------------
 
@@ -80,3 +81,18 @@ class Filter:
     """
     The filter configuration.
     """
+
+
+# -----------------------------------------------------------------------------
+# Functions
+# -----------------------------------------------------------------------------
+
+
+def _compile(patterns: list[str]) -> re.Pattern[str]:
+    """Compile glob patterns into a single regular expression.
+
+    Patterns are normalized and translated just like `fnmatch` does, and joined
+    into an alternation. An empty list of patterns never matches.
+    """
+    alternatives = [translate(os.path.normcase(p)) for p in patterns]
+    return re.compile("|".join(alternatives) or "(?!)")
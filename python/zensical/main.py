@@ -69,12 +69,7 @@ def cli() -> None:
 def execute_build(config_file: str | None, **kwargs: Any) -> None:
     """Build a project."""
     if config_file is None:
-        for file in ["zensical.toml", "mkdocs.yml", "mkdocs.yaml"]:
-            if os.path.exists(file):
-                config_file = file
-                break
-        else:
-            raise ClickException("No config file found in the current folder.")
+        config_file = _find_config_file()
 
     # Build project in Rust runtime, calling back into Python when necessary,
     # e.g., to parse MkDocs configuration format or render Markdown
@@ -112,12 +107,7 @@ def execute_build(config_file: str | None, **kwargs: Any) -> None:
 def execute_serve(config_file: str | None, **kwargs: Any) -> None:
     """Build and serve a project."""
     if config_file is None:
-        for file in ["zensical.toml", "mkdocs.yml", "mkdocs.yaml"]:
-            if os.path.exists(file):
-                config_file = file
-                break
-        else:
-            raise ClickException("No config file found in the current folder.")
+        config_file = _find_config_file()
     if kwargs.get("strict", False):
         print("Warning: Strict mode is currently unsupported.")
 
@@ -162,6 +152,25 @@ def new_project(directory: str | None, **kwargs: Any) -> None:  # noqa: ARG001
                 shutil.copyfile(src_file, dest_file)
 
 
+# ----------------------------------------------------------------------------
+# Functions
+# ----------------------------------------------------------------------------
+
+
+def _find_config_file() -> str:
+    """Find the config file in the current folder.
+
+    We check for the existence of each candidate in order of precedence, which
+    takes at most three `stat` calls and respects case-insensitive file systems.
+    """
+    for file in ("zensical.toml", "mkdocs.yml", "mkdocs.yaml"):
+        if os.path.exists(file):
+            return file
+
+    # No config file found
+    raise ClickException("No config file found in the current folder.")
+
+
 # ----------------------------------------------------------------------------
 # Program
 # ----------------------------------------------------------------------------
@@ -29,7 +29,6 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 from markdown import Markdown
-from yaml import SafeLoader
 
 from zensical.config import get_config
 from zensical.extensions.autorefs import set_autorefs_page
@@ -37,6 +36,11 @@ from zensical.extensions.context import ContextExtension, Page
 from zensical.extensions.links import LinksExtension
 from zensical.extensions.search import SearchExtension
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 if TYPE_CHECKING:
     from zensical.extensions.search import SearchProcessor
 
@@ -70,8 +74,9 @@ def render(content: str, path: str, url: str) -> dict:
     # First, extract metadata - the Python Markdown parser brings a metadata
     # extension, but the implementation is broken, as it does not support full
     # YAML syntax, e.g. lists. Thus, we just parse the metadata with YAML.
+    # Most pages don't have front matter, so we check for it cheaply first.
     meta: dict = {}
-    if match := FRONT_MATTER_RE.match(content):
+    if content.startswith("---") and (match := FRONT_MATTER_RE.match(content)):
         try:
             meta = yaml.load(match.group(1), SafeLoader)
             if isinstance(meta, dict):
@@ -137,7 +142,7 @@ def render(content: str, path: str, url: str) -> dict:
         "title": "",
         "content": content,
         "search": search_processor.data,
-        "toc": [_convert_toc(item) for item in getattr(md, "toc_tokens", [])],
+        "toc": _convert_toc(getattr(md, "toc_tokens", [])),
     }
 
 
@@ -154,23 +159,34 @@ def _sanitize(value: Any) -> Any:
     return value
 
 
-def _convert_toc(item: Any) -> dict:
-    """Convert a table of contents item to navigation item format."""
-    toc_item = {
-        "title": item["data-toc-label"] or item["name"],
-        "content": item["data-toc-label"] or _cleanup_toc_label(item["html"]),
-        "id": item["id"],
-        "url": f"#{item['id']}",
-        "children": [],
-        "level": item["level"],
-    }
-
-    # Recursively convert items
-    for child in item["children"]:
-        toc_item["children"].append(_convert_toc(child))
+def _convert_toc(items: list) -> list[dict]:
+    """Convert table of contents items to navigation item format.
 
-    # Return table of contents item
-    return toc_item
+    Items are converted iteratively, appending each item to the children of
+    its converted parent, which avoids a function call per item.
+    """
+    result: list[dict] = []
+    stack: list[tuple[list, list[dict]]] = [(items, result)]
+    while stack:
+        items, converted = stack.pop()
+        for item in items:
+            label = item["data-toc-label"]
+            toc_item = {
+                "title": label or item["name"],
+                "content": label or _cleanup_toc_label(item["html"]),
+                "id": item["id"],
+                "url": f"#{item['id']}",
+                "children": [],
+                "level": item["level"],
+            }
+
+            # Convert children later, and append item to converted items
+            if item["children"]:
+                stack.append((item["children"], toc_item["children"]))
+            converted.append(toc_item)
+
+    # Return table of contents
+    return result
 
 
 def _cleanup_toc_label(html: str) -> str:
@@ -26,6 +26,7 @@
 # IN THE SOFTWARE.
 
 import os
+import shutil
 import subprocess
 
 # ----------------------------------------------------------------------------
@@ -37,13 +38,25 @@ def main() -> int:
     """Prepare production build."""
     os.makedirs("tmp", exist_ok=True)
 
-    # Clone UI repository into tmp directory
+    # Clone UI repository at the given tag into tmp directory - we only need the
+    # tree of the tag, so a shallow clone is sufficient and much faster
     repo_url = "https://github.com/zensical/ui.git"
     repo_tag = "v0.0.19"
     dest_dir = os.path.join("tmp", "ui")
     if not os.path.exists(dest_dir):
-        subprocess.run(["git", "clone", repo_url, dest_dir], check=True)
-        subprocess.run(["git", "checkout", repo_tag], cwd=dest_dir, check=True)
+        subprocess.run(
+            [
+                "git",
+                "clone",
+                "--branch",
+                repo_tag,
+                "--depth",
+                "1",
+                repo_url,
+                dest_dir,
+            ],
+            check=True,
+        )
 
     # Determine base and dist directories
     base_dir = os.path.join("python", "zensical")
@@ -62,8 +75,8 @@ def main() -> int:
     path = os.path.join(base_dir, "templates")
     if os.path.exists(dist_dir):
         if os.path.exists(path):
-            subprocess.run(["rm", "-rf", path], check=True)
-        subprocess.run(["cp", "-r", dist_dir, path], check=True)
+            shutil.rmtree(path)
+        shutil.copytree(dist_dir, path, symlinks=True)
 
     return 0
 